@@ -6,6 +6,7 @@ Each migration runs in its own transaction for atomicity.
 """
 
 import logging
+import os
 import re
 from pathlib import Path
 from typing import List, Set, Tuple
@@ -16,7 +17,12 @@ logger = logging.getLogger(__name__)
 
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
-MIGRATION_PATTERN = re.compile(r"^(\d{3})_.+\.sql$")
+MIGRATION_PATTERN = re.compile(r"^(\d{3,})_.+\.sql$")
+
+
+def _migration_sort_key(migration: Tuple[str, str, Path]) -> Tuple[int, str]:
+    """Order migrations numerically by version, then by filename."""
+    return int(migration[0]), migration[1]
 
 
 async def ensure_migration_table(conn: asyncpg.Connection) -> None:
@@ -31,52 +37,91 @@ async def ensure_migration_table(conn: asyncpg.Connection) -> None:
         """)
 
 
+class FilesystemMigrationLoader:
+    """Lists and reads migration files from MIGRATIONS_DIR on disk."""
+
+    def list(self) -> List[Tuple[str, str, Path]]:
+        """
+        Scan MIGRATIONS_DIR for migration files.
+
+        Returns:
+            Unordered list of (version, filename, path) tuples.
+
+        Raises:
+            FileNotFoundError: If the migrations directory doesn't exist.
+        """
+        if not MIGRATIONS_DIR.is_dir():
+            raise FileNotFoundError(f"Migrations directory not found: {MIGRATIONS_DIR}")
+
+        migrations = []
+        # os.scandir exposes the file type from the directory listing itself,
+        # so checking is_file() does not cost an extra stat() per entry.
+        with os.scandir(MIGRATIONS_DIR) as entries:
+            for entry in entries:
+                match = MIGRATION_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    version = match.group(1)
+                    migrations.append((version, entry.name, Path(entry.path)))
+        return migrations
+
+    def read(self, path: Path) -> str:
+        """Return the SQL contents of a migration file."""
+        return path.read_text(encoding="utf-8")
+
+
+# Source of migration files. Swappable so callers (and tests) can supply
+# migrations without touching the filesystem.
+MIGRATION_LOADER = FilesystemMigrationLoader()
+
+
 def discover_migrations() -> List[Tuple[str, str, Path]]:
     """
-    Discover migration files in the migrations directory.
+    Discover migration files via MIGRATION_LOADER.
 
     Returns:
-        Sorted list of (version, filename, path) tuples.
+        List of (version, filename, path) tuples sorted by numeric version.
 
     Raises:
         FileNotFoundError: If the migrations directory doesn't exist.
     """
-    if not MIGRATIONS_DIR.is_dir():
-        raise FileNotFoundError(f"Migrations directory not found: {MIGRATIONS_DIR}")
-
-    migrations = []
-    for entry in sorted(MIGRATIONS_DIR.iterdir()):
-        match = MIGRATION_PATTERN.match(entry.name)
-        if match and entry.is_file():
-            version = match.group(1)
-            migrations.append((version, entry.name, entry))
+    migrations = MIGRATION_LOADER.list()
 
+    # Order numerically so that e.g. 1000_x.sql follows 999_y.sql; the key
+    # is computed once per entry rather than on every comparison.
+    migrations.sort(key=_migration_sort_key)
     return migrations
 
 
 async def get_applied_versions(conn: asyncpg.Connection) -> Set[str]:
     """Get the set of already-applied migration versions."""
+    # A single fetch is cheaper than a server-side cursor here: the table
+    # holds one short row per migration, and a cursor would need its own
+    # transaction plus a round trip per prefetch batch.
     rows = await conn.fetch("SELECT version FROM schema_migrations")
     return {row["version"] for row in rows}
 
 
 async def apply_migration(
-    pool: asyncpg.Pool, version: str, filename: str, path: Path
+    pool: asyncpg.Pool, version: str, filename: str, sql: str
 ) -> None:
     """
     Apply a single migration in its own transaction.
 
+    The SQL is passed in already read so that no filesystem I/O happens
+    while the connection is held.
+
     Args:
         pool: asyncpg connection pool.
         version: Migration version string (e.g. "001").
         filename: Migration filename for audit trail.
-        path: Full path to the SQL file.
+        sql: Contents of the migration file.
     """
-    sql = path.read_text(encoding="utf-8")
-
     async with pool.acquire() as conn:
         async with conn.transaction():
             await conn.execute(sql)
+            # Record the version in the same transaction as the DDL rather
+            # than batching inserts after the loop: a later failure must not
+            # roll back the record of a migration that has already committed.
             await conn.execute(
                 "INSERT INTO schema_migrations (version, filename) " "VALUES ($1, $2)",
                 version,
@@ -114,26 +159,34 @@ async def run_migrations(pool: asyncpg.Pool) -> int:
 
     async with pool.acquire() as conn:
         # Acquire a session-level advisory lock — blocks until the lock is free.
-        # This ensures only one instance runs migrations at a time.
-        await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_KEY)
+        # This ensures only one instance runs migrations at a time. The lock is
+        # taken in the FROM clause so it is held before the tracking table is
+        # looked up, and both happen in a single round trip.
+        table_exists = await conn.fetchval(
+            "SELECT to_regclass('schema_migrations') IS NOT NULL "
+            "FROM pg_advisory_lock($1)",
+            MIGRATION_LOCK_KEY,
+        )
         try:
-            await ensure_migration_table(conn)
+            if not table_exists:
+                await ensure_migration_table(conn)
             # Re-read applied versions *inside* the lock so we see any
             # migrations already applied by another instance that held the
             # lock before us.
             applied = await get_applied_versions(conn)
-            pending = [
-                (v, name, path) for v, name, path in all_migrations if v not in applied
-            ]
+            pending_versions = {v for v, _, _ in all_migrations}.difference(applied)
 
-            if not pending:
+            if not pending_versions:
                 logger.info("Database schema is up to date")
                 return 0
 
+            pending = [m for m in all_migrations if m[0] in pending_versions]
+
             logger.info(f"Applying {len(pending)} pending migration(s)")
 
             for version, filename, path in pending:
-                await apply_migration(pool, version, filename, path)
+                sql = MIGRATION_LOADER.read(path)
+                await apply_migration(pool, version, filename, sql)
 
             logger.info(f"Successfully applied {len(pending)} migration(s)")
             return len(pending)
@@ -7,10 +7,31 @@ Provides functions to validate resource specs against OpenAPI v3 schemas.
 import logging
 from typing import Any, Dict, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError
+from jsonschema import Draft7Validator, SchemaError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Draft 7 keywords that only annotate a schema and never reject an instance
+_ANNOTATION_KEYWORDS = frozenset(
+    (
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "readOnly",
+        "writeOnly",
+        "definitions",
+    )
+)
+
+# Draft 7 meta-schema validator, built once rather than on every check_schema call
+_META_VALIDATOR = Draft7Validator(
+    Draft7Validator.META_SCHEMA, format_checker=Draft7Validator.FORMAT_CHECKER
+)
+
 
 def validate_openapi_schema(schema: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -22,9 +43,15 @@ def validate_openapi_schema(schema: Dict[str, Any]) -> Tuple[bool, Optional[str]
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if schema == {}:
+        # The empty schema is always valid
+        return True, None
+
     try:
         # Check that schema is a valid JSON Schema (Draft 7, which OpenAPI 3.0 uses)
-        Draft7Validator.check_schema(schema)
+        error = next(_META_VALIDATOR.iter_errors(schema), None)
+        if error is not None:
+            raise SchemaError.create_from(error)
         return True, None
     except Exception as e:
         return False, f"Invalid schema: {str(e)}"
@@ -43,6 +70,10 @@ def validate_spec_against_schema(
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if isinstance(schema, dict) and _ANNOTATION_KEYWORDS.issuperset(schema):
+        # Nothing in the schema can reject a spec, so skip building a validator
+        return True, None
+
     try:
         validator = Draft7Validator(
             schema, format_checker=Draft7Validator.FORMAT_CHECKER
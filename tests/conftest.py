@@ -6,13 +6,20 @@ from unittest.mock import AsyncMock, MagicMock
 
 from auth import AuthManager
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+
+def _new_test_event_loop():
+    """Create the event loop async tests run on."""
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed."""
+    return {"uvloop" if uvloop else "asyncio": _new_test_event_loop}
 
 
 @pytest.fixture
@@ -23,6 +30,31 @@ def mock_pool():
     return pool
 
 
+class AcquireContext:
+    """Async context manager standing in for ``pool.acquire()``."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def make_pool():
+    """Factory for a mock asyncpg pool whose acquire() yields ``conn``."""
+
+    def _make_pool(conn):
+        pool = AsyncMock()
+        pool.acquire = MagicMock(return_value=AcquireContext(conn))
+        return pool
+
+    return _make_pool
+
+
 @pytest.fixture
 def mock_connection():
     """Create a mock asyncpg connection."""
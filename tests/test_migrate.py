@@ -1,8 +1,9 @@
 """Unit tests for migrate.py - Database migration runner."""
 
 import pytest
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
-from contextlib import asynccontextmanager
 
 import pglast
 import migrate
@@ -15,18 +16,41 @@ from migrate import (
     run_migrations,
 )
 
+CANONICAL_MIGRATIONS = {
+    "001_initial.sql": "CREATE TABLE t1 (id INT);",
+    "002_update.sql": "ALTER TABLE t1 ADD col TEXT;",
+    "003_index.sql": "CREATE INDEX idx ON t1(id);",
+}
+
+
+class DictMigrationLoader:
+    """In-memory stand-in for FilesystemMigrationLoader keyed by filename."""
+
+    def __init__(self, files):
+        self.files = files
+
+    def list(self):
+        return [(name.split("_", 1)[0], name, Path(name)) for name in self.files.keys()]
+
+    def read(self, path):
+        return self.files[path.name]
+
+
+@pytest.fixture(scope="module")
+def canonical_migrations(tmp_path_factory):
+    """Directory holding CANONICAL_MIGRATIONS, written once for read-only tests."""
+    directory = tmp_path_factory.mktemp("migrations")
+    for name, sql in CANONICAL_MIGRATIONS.items():
+        (directory / name).write_text(sql)
+    return directory
+
 
 class TestDiscoverMigrations:
     """Tests for discover_migrations function."""
 
-    def test_returns_sorted_list(self, tmp_path, monkeypatch):
+    def test_returns_sorted_list(self, canonical_migrations, monkeypatch):
         """Test migrations are discovered and sorted by version."""
-        (tmp_path / "002_add_column.sql").write_text(
-            "ALTER TABLE resources ADD col TEXT;"
-        )
-        (tmp_path / "001_initial.sql").write_text("CREATE TABLE test (id INT);")
-        (tmp_path / "003_add_index.sql").write_text("CREATE INDEX idx ON test(id);")
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", canonical_migrations)
 
         result = discover_migrations()
 
@@ -36,6 +60,16 @@ class TestDiscoverMigrations:
         assert result[1][0] == "002"
         assert result[2][0] == "003"
 
+    def test_sorts_beyond_999(self, tmp_path, monkeypatch):
+        """Test versions are ordered numerically once they exceed three digits."""
+        (tmp_path / "1000_y.sql").write_text("SELECT 1;")
+        (tmp_path / "999_x.sql").write_text("SELECT 1;")
+        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+
+        result = discover_migrations()
+
+        assert [m[1] for m in result] == ["999_x.sql", "1000_y.sql"]
+
     def test_skips_non_sql_files(self, tmp_path, monkeypatch):
         """Test that non-SQL files are ignored."""
         (tmp_path / "001_initial.sql").write_text("CREATE TABLE test (id INT);")
@@ -104,12 +138,17 @@ class TestEnsureMigrationTable:
 
     async def test_executes_create_table(self):
         """Test that CREATE TABLE is executed."""
-        conn = AsyncMock()
+        executed = []
+
+        async def execute(sql, *args):
+            executed.append((sql, args))
+
+        conn = SimpleNamespace(execute=execute)
 
         await ensure_migration_table(conn)
 
-        conn.execute.assert_called_once()
-        sql = conn.execute.call_args[0][0]
+        assert len(executed) == 1
+        sql = executed[0][0]
         assert "CREATE TABLE IF NOT EXISTS schema_migrations" in sql
         assert "version" in sql
         assert "filename" in sql
@@ -122,8 +161,11 @@ class TestGetAppliedVersions:
 
     async def test_returns_version_set(self):
         """Test that applied versions are returned as a set."""
-        conn = AsyncMock()
-        conn.fetch = AsyncMock(return_value=[{"version": "001"}, {"version": "002"}])
+
+        async def fetch(sql, *args):
+            return [{"version": "001"}, {"version": "002"}]
+
+        conn = SimpleNamespace(fetch=fetch)
 
         result = await get_applied_versions(conn)
 
@@ -131,8 +173,11 @@ class TestGetAppliedVersions:
 
     async def test_returns_empty_set(self):
         """Test empty table returns empty set."""
-        conn = AsyncMock()
-        conn.fetch = AsyncMock(return_value=[])
+
+        async def fetch(sql, *args):
+            return []
+
+        conn = SimpleNamespace(fetch=fetch)
 
         result = await get_applied_versions(conn)
 
@@ -143,26 +188,19 @@ class TestGetAppliedVersions:
 class TestApplyMigration:
     """Tests for apply_migration function."""
 
-    async def test_executes_sql_and_records(self, tmp_path):
+    async def test_executes_sql_and_records(self, make_pool):
         """Test that migration SQL is executed and recorded."""
-        sql_file = tmp_path / "001_initial.sql"
-        sql_file.write_text("CREATE TABLE test (id INT);")
-
         conn = AsyncMock()
         mock_transaction = AsyncMock()
         mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
         mock_transaction.__aexit__ = AsyncMock(return_value=False)
         conn.transaction = MagicMock(return_value=mock_transaction)
 
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
-
-        pool.acquire = mock_acquire
+        pool = make_pool(conn)
 
-        await apply_migration(pool, "001", "001_initial.sql", sql_file)
+        await apply_migration(
+            pool, "001", "001_initial.sql", "CREATE TABLE test (id INT);"
+        )
 
         assert conn.execute.call_count == 2
         conn.execute.assert_any_call("CREATE TABLE test (id INT);")
@@ -172,11 +210,29 @@ class TestApplyMigration:
             "001_initial.sql",
         )
 
-    async def test_propagates_exception(self, tmp_path):
-        """Test that SQL errors propagate."""
-        sql_file = tmp_path / "001_bad.sql"
-        sql_file.write_text("INVALID SQL;")
+    async def test_records_inside_migration_transaction(self, make_pool):
+        """Test that the version is recorded before the transaction commits."""
+        conn = AsyncMock()
+        executed_at_commit = []
+        mock_transaction = AsyncMock()
+        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
+
+        async def record_commit(*args):
+            executed_at_commit.append(conn.execute.call_count)
+            return False
+
+        mock_transaction.__aexit__ = AsyncMock(side_effect=record_commit)
+        conn.transaction = MagicMock(return_value=mock_transaction)
+
+        pool = make_pool(conn)
 
+        await apply_migration(pool, "001", "001_initial.sql", "SELECT 1;")
+
+        assert executed_at_commit == [2]
+        conn.copy_records_to_table.assert_not_called()
+
+    async def test_propagates_exception(self, make_pool):
+        """Test that SQL errors propagate."""
         conn = AsyncMock()
         conn.execute = AsyncMock(side_effect=Exception("syntax error"))
         mock_transaction = AsyncMock()
@@ -184,28 +240,20 @@ class TestApplyMigration:
         mock_transaction.__aexit__ = AsyncMock(return_value=False)
         conn.transaction = MagicMock(return_value=mock_transaction)
 
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
-
-        pool.acquire = mock_acquire
+        pool = make_pool(conn)
 
         with pytest.raises(Exception, match="syntax error"):
-            await apply_migration(pool, "001", "001_bad.sql", sql_file)
+            await apply_migration(pool, "001", "001_bad.sql", "INVALID SQL;")
 
 
 @pytest.mark.asyncio
 class TestRunMigrations:
     """Tests for run_migrations function."""
 
-    async def test_applies_pending_migrations(self, tmp_path, monkeypatch):
+    async def test_applies_pending_migrations(self, monkeypatch, make_pool):
         """Test that only pending migrations are applied."""
-        (tmp_path / "001_initial.sql").write_text("CREATE TABLE t1 (id INT);")
-        (tmp_path / "002_update.sql").write_text("ALTER TABLE t1 ADD col TEXT;")
-        (tmp_path / "003_index.sql").write_text("CREATE INDEX idx ON t1(id);")
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+        loader = DictMigrationLoader(CANONICAL_MIGRATIONS)
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", loader)
 
         conn = AsyncMock()
         conn.fetch = AsyncMock(return_value=[{"version": "001"}])
@@ -215,24 +263,21 @@ class TestRunMigrations:
         mock_transaction.__aexit__ = AsyncMock(return_value=False)
         conn.transaction = MagicMock(return_value=mock_transaction)
 
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
-
-        pool.acquire = mock_acquire
+        pool = make_pool(conn)
 
         result = await run_migrations(pool)
 
         assert result == 2
+        conn.execute.assert_any_call("ALTER TABLE t1 ADD col TEXT;")
+        conn.execute.assert_any_call("CREATE INDEX idx ON t1(id);")
 
-    async def test_fresh_database(self, tmp_path, monkeypatch):
+    async def test_fresh_database(self, monkeypatch, make_pool):
         """Test applying migrations on a fresh database."""
-        (tmp_path / "001_initial.sql").write_text("CREATE TABLE t1 (id INT);")
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+        loader = DictMigrationLoader({"001_initial.sql": "CREATE TABLE t1 (id INT);"})
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", loader)
 
         conn = AsyncMock()
+        conn.fetchval = AsyncMock(return_value=False)
         conn.fetch = AsyncMock(return_value=[])
 
         mock_transaction = AsyncMock()
@@ -240,84 +285,71 @@ class TestRunMigrations:
         mock_transaction.__aexit__ = AsyncMock(return_value=False)
         conn.transaction = MagicMock(return_value=mock_transaction)
 
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
-
-        pool.acquire = mock_acquire
+        pool = make_pool(conn)
 
         result = await run_migrations(pool)
 
         assert result == 1
 
-    async def test_no_pending_migrations(self, tmp_path, monkeypatch):
+    async def test_no_pending_migrations(self, monkeypatch, make_pool):
         """Test when all migrations are already applied."""
-        (tmp_path / "001_initial.sql").write_text("CREATE TABLE t1 (id INT);")
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+        loader = DictMigrationLoader({"001_initial.sql": "CREATE TABLE t1 (id INT);"})
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", loader)
 
         conn = AsyncMock()
         conn.fetch = AsyncMock(return_value=[{"version": "001"}])
 
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
-
-        pool.acquire = mock_acquire
+        pool = make_pool(conn)
 
         result = await run_migrations(pool)
 
         assert result == 0
 
-    async def test_no_migration_files(self, tmp_path, monkeypatch):
-        """Test with empty migrations directory."""
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
-
-        pool = AsyncMock()
-
-        @asynccontextmanager
-        async def mock_acquire():
-            conn = AsyncMock()
-            yield conn
+    async def test_no_migration_files(self, monkeypatch, make_pool):
+        """Test with no migration files."""
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", DictMigrationLoader({}))
 
-        pool.acquire = mock_acquire
+        pool = make_pool(AsyncMock())
 
         result = await run_migrations(pool)
 
         assert result == 0
 
-    async def test_ensures_migration_table_first(self, tmp_path, monkeypatch):
+    async def test_ensures_migration_table_first(self, monkeypatch, make_pool):
         """Test that schema_migrations table is created inside the advisory lock."""
-        (tmp_path / "001_initial.sql").write_text("SELECT 1;")
-        monkeypatch.setattr(migrate, "MIGRATIONS_DIR", tmp_path)
+        loader = DictMigrationLoader({"001_initial.sql": "SELECT 1;"})
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", loader)
 
         conn = AsyncMock()
+        conn.fetchval = AsyncMock(return_value=False)
         conn.fetch = AsyncMock(return_value=[{"version": "001"}])
 
-        pool = AsyncMock()
+        pool = make_pool(conn)
 
-        @asynccontextmanager
-        async def mock_acquire():
-            yield conn
+        await run_migrations(pool)
 
-        pool.acquire = mock_acquire
+        call_sql = [c.args[0] for c in conn.mock_calls if c.args]
+        assert "pg_advisory_lock" in call_sql[0]
+        assert "to_regclass('schema_migrations')" in call_sql[0]
+        # Advisory lock must be acquired before the CREATE TABLE
+        assert "CREATE TABLE IF NOT EXISTS schema_migrations" in call_sql[1]
+
+    async def test_skips_create_when_table_exists(self, monkeypatch, make_pool):
+        """Test the tracking table DDL is skipped once the table exists."""
+        loader = DictMigrationLoader({"001_initial.sql": "SELECT 1;"})
+        monkeypatch.setattr(migrate, "MIGRATION_LOADER", loader)
+
+        conn = AsyncMock()
+        conn.fetchval = AsyncMock(return_value=True)
+        conn.fetch = AsyncMock(return_value=[{"version": "001"}])
+
+        pool = make_pool(conn)
 
         await run_migrations(pool)
 
-        call_args_list = [call[0][0] for call in conn.execute.call_args_list]
-        assert any("pg_advisory_lock" in c for c in call_args_list)
-        assert any(
-            "CREATE TABLE IF NOT EXISTS schema_migrations" in c for c in call_args_list
-        )
-        # Advisory lock must be acquired before the CREATE TABLE
-        lock_idx = next(
-            i for i, c in enumerate(call_args_list) if "pg_advisory_lock" in c
-        )
-        table_idx = next(i for i, c in enumerate(call_args_list) if "CREATE TABLE" in c)
-        assert lock_idx < table_idx
+        executed = [c.args[0] for c in conn.execute.call_args_list]
+        assert not any("CREATE TABLE" in sql for sql in executed)
+        assert any("pg_advisory_unlock" in sql for sql in executed)
 
 
 class TestMigrationSqlSyntax:
@@ -1,46 +1,66 @@
 """Unit tests for the reconciler plugin system."""
 
 import asyncio
-from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
 
 from controller import Controller, ControllerConfig
-from db import ResourceStatus
+from db import DatabaseManager, ResourceStatus
+from events import EventBus, EventType, ResourceEvent
 from plugins.reconcilers.base import (
     BaseReconciler,
     ReconcilerPlugin,
     ReconcilerContext,
     ReconcileResult,
 )
-from plugins.registry import PluginRegistry, reset_registry
+from plugins.registry import (
+    PluginRegistry,
+    get_registry,
+    register_builtin_plugins,
+    reset_registry,
+)
 
 # ==================== Test Helpers ====================
 
+# Shared results for tests that only read them; do not mutate.
+RESULT_OK = ReconcileResult(success=True, message="OK")
+RESULT_CONNECTION_REFUSED = ReconcileResult(success=False, message="Connection refused")
+
+
+def async_return(value=None):
+    """
+    Lightweight stand-in for AsyncMock(return_value=value).
+
+    A MagicMock whose calls return a coroutine resolving to its current
+    return_value, so call assertions and ``.return_value = ...`` still work.
+    """
+    mock = MagicMock(return_value=value)
+
+    async def _result():
+        return mock.return_value
+
+    mock.side_effect = lambda *args, **kwargs: _result()
+    return mock
+
 
 class DummyReconciler(ReconcilerPlugin):
     """Concrete reconciler for testing."""
 
+    name = "dummy"
+    resource_types = ["DummyResource"]
+
     def __init__(self):
         self._started = False
         self._stopped = False
 
-    @property
-    def name(self) -> str:
-        return "dummy"
-
-    @property
-    def resource_types(self) -> list[str]:
-        return ["DummyResource"]
-
     async def start(self, ctx: ReconcilerContext) -> None:
         self._started = True
         # Wait for shutdown
         await ctx.shutdown_event.wait()
 
     async def reconcile(self, resource, ctx):
-        return ReconcileResult(success=True, message="OK")
+        return RESULT_OK
 
     async def stop(self) -> None:
         self._stopped = True
@@ -49,13 +69,8 @@ class DummyReconciler(ReconcilerPlugin):
 class MultiTypeReconciler(ReconcilerPlugin):
     """Reconciler that handles multiple resource types."""
 
-    @property
-    def name(self) -> str:
-        return "multi"
-
-    @property
-    def resource_types(self) -> list[str]:
-        return ["TypeA", "TypeB"]
+    name = "multi"
+    resource_types = ["TypeA", "TypeB"]
 
     async def start(self, ctx):
         await ctx.shutdown_event.wait()
@@ -67,6 +82,20 @@ class MultiTypeReconciler(ReconcilerPlugin):
         pass
 
 
+@pytest.fixture(scope="module")
+def registry_autospec():
+    """A PluginRegistry autospec built once per module; see mock_registry."""
+    return create_autospec(PluginRegistry, instance=True)
+
+
+@pytest.fixture
+def mock_registry(registry_autospec):
+    """The shared PluginRegistry mock, reset to a clean state for this test."""
+    registry_autospec.reset_mock(return_value=True, side_effect=True)
+    registry_autospec.list_reconciler_plugins.return_value = []
+    return registry_autospec
+
+
 # ==================== ReconcileResult Tests ====================
 
 
@@ -130,23 +159,17 @@ class TestReconcilerContext:
 
     @pytest.fixture
     def mock_db(self):
-        db = AsyncMock()
-        db.get_resources_needing_reconciliation_by_type = AsyncMock(return_value=[])
+        db = AsyncMock(spec=DatabaseManager)
+        db.get_resources_needing_reconciliation_by_type = async_return([])
         db.update_resource_status = AsyncMock()
         db.record_reconciliation = AsyncMock()
         db.add_finalizer = AsyncMock()
         db.remove_finalizer = AsyncMock()
-        db.get_finalizers = AsyncMock(return_value=[])
-        db.hard_delete_resource = AsyncMock(return_value=True)
+        db.get_finalizers = async_return([])
+        db.hard_delete_resource = async_return(True)
         db.mark_resource_for_reconciliation = AsyncMock()
         return db
 
-    @pytest.fixture
-    def mock_registry(self):
-        registry = MagicMock()
-        registry.get_action_plugin = AsyncMock()
-        return registry
-
     @pytest.fixture
     def ctx(self, mock_db, mock_registry):
         return ReconcilerContext(
@@ -213,11 +236,9 @@ class TestReconcilerContext:
 
     async def test_record_reconciliation_success(self, ctx, mock_db):
         """Test recording a successful reconciliation."""
-        result = ReconcileResult(success=True, message="OK")
-
         await ctx.record_reconciliation(
             resource_id=1,
-            result=result,
+            result=RESULT_OK,
             duration_seconds=1.5,
             trigger_reason="initial",
         )
@@ -234,11 +255,9 @@ class TestReconcilerContext:
 
     async def test_record_reconciliation_failure(self, ctx, mock_db):
         """Test recording a failed reconciliation."""
-        result = ReconcileResult(success=False, message="Connection refused")
-
         await ctx.record_reconciliation(
             resource_id=1,
-            result=result,
+            result=RESULT_CONNECTION_REFUSED,
             duration_seconds=0.3,
             trigger_reason="retry",
             drift_detected=True,
@@ -378,16 +397,12 @@ class TestBaseReconcilerAsync:
 
     @pytest.fixture
     def mock_db(self):
-        db = AsyncMock()
+        db = AsyncMock(spec=DatabaseManager)
         db.get_resources_needing_reconciliation_by_type = AsyncMock(return_value=[])
         db.record_reconciliation = AsyncMock()
         db.mark_resource_for_reconciliation = AsyncMock()
         return db
 
-    @pytest.fixture
-    def mock_registry(self):
-        return MagicMock()
-
     def _make_ctx(self, mock_db, mock_registry, shutdown_event=None):
         return ReconcilerContext(
             db=mock_db,
@@ -481,48 +496,49 @@ class TestBaseReconcilerAsync:
 # ==================== PluginRegistry Reconciler Tests ====================
 
 
+@pytest.fixture
+def fresh_registry():
+    """Ensure a fresh global registry for each test.
+
+    reset_registry() only drops the singleton, so this is cheap and leaves
+    no state behind for the next test.
+    """
+    reset_registry()
+    yield
+    reset_registry()
+
+
+@pytest.mark.usefixtures("fresh_registry")
 class TestPluginRegistryReconciler:
     """Tests for reconciler support in PluginRegistry."""
 
-    @pytest.fixture(autouse=True)
-    def fresh_registry(self):
-        """Ensure a fresh registry for each test."""
-        reset_registry()
-        yield
-        reset_registry()
-
-    def test_register_reconciler_plugin(self):
-        """Test registering a reconciler plugin."""
+    @pytest.fixture
+    def registry_with_dummy(self):
+        """A registry with DummyReconciler registered."""
         registry = PluginRegistry()
         registry.register_reconciler_plugin(DummyReconciler)
+        return registry
 
-        assert "dummy" in registry.list_reconciler_plugins()
+    def test_register_reconciler_plugin(self, registry_with_dummy):
+        """Test registering a reconciler plugin."""
+        assert "dummy" in registry_with_dummy.list_reconciler_plugins()
 
-    def test_register_reconciler_info(self):
+    def test_register_reconciler_info(self, registry_with_dummy):
         """Test reconciler plugin info is cached."""
-        registry = PluginRegistry()
-        registry.register_reconciler_plugin(DummyReconciler)
-
-        info = registry.get_reconciler_plugin_info("dummy")
+        info = registry_with_dummy.get_reconciler_plugin_info("dummy")
         assert info is not None
         assert info["name"] == "dummy"
         assert info["resource_types"] == ["DummyResource"]
 
-    def test_get_reconciler_plugin(self):
+    def test_get_reconciler_plugin(self, registry_with_dummy):
         """Test getting a reconciler instance."""
-        registry = PluginRegistry()
-        registry.register_reconciler_plugin(DummyReconciler)
-
-        instance = registry.get_reconciler_plugin("dummy")
+        instance = registry_with_dummy.get_reconciler_plugin("dummy")
         assert isinstance(instance, DummyReconciler)
 
-    def test_get_reconciler_plugin_cached(self):
+    def test_get_reconciler_plugin_cached(self, registry_with_dummy):
         """Test that reconciler instances are cached."""
-        registry = PluginRegistry()
-        registry.register_reconciler_plugin(DummyReconciler)
-
-        instance1 = registry.get_reconciler_plugin("dummy")
-        instance2 = registry.get_reconciler_plugin("dummy")
+        instance1 = registry_with_dummy.get_reconciler_plugin("dummy")
+        instance2 = registry_with_dummy.get_reconciler_plugin("dummy")
         assert instance1 is instance2
 
     def test_get_unknown_reconciler_raises(self):
@@ -532,20 +548,21 @@ class TestPluginRegistryReconciler:
         with pytest.raises(ValueError, match="Unknown reconciler plugin"):
             registry.get_reconciler_plugin("nonexistent")
 
-    def test_has_reconciler_for_resource_type(self):
+    @pytest.mark.parametrize(
+        "resource_type,expected", [("DummyResource", True), ("Unknown", False)]
+    )
+    def test_has_reconciler_for_resource_type(
+        self, registry_with_dummy, resource_type, expected
+    ):
         """Test checking if a reconciler handles a resource type."""
-        registry = PluginRegistry()
-        registry.register_reconciler_plugin(DummyReconciler)
-
-        assert registry.has_reconciler_for_resource_type("DummyResource") is True
-        assert registry.has_reconciler_for_resource_type("Unknown") is False
+        result = registry_with_dummy.has_reconciler_for_resource_type(resource_type)
+        assert result is expected
 
-    def test_get_reconciler_for_resource_type(self):
+    def test_get_reconciler_for_resource_type(self, registry_with_dummy):
         """Test getting the reconciler for a resource type."""
-        registry = PluginRegistry()
-        registry.register_reconciler_plugin(DummyReconciler)
-
-        reconciler = registry.get_reconciler_for_resource_type("DummyResource")
+        reconciler = registry_with_dummy.get_reconciler_for_resource_type(
+            "DummyResource"
+        )
         assert isinstance(reconciler, DummyReconciler)
 
     def test_get_reconciler_for_unknown_resource_type(self):
@@ -573,13 +590,8 @@ class TestPluginRegistryReconciler:
         registry.register_reconciler_plugin(DummyReconciler)
 
         class ConflictingReconciler(ReconcilerPlugin):
-            @property
-            def name(self):
-                return "conflicting"
-
-            @property
-            def resource_types(self):
-                return ["DummyResource"]  # Already claimed by dummy
+            name = "conflicting"
+            resource_types = ["DummyResource"]  # Already claimed by dummy
 
             async def start(self, ctx):
                 pass
@@ -616,17 +628,37 @@ class TestPluginRegistryReconciler:
 # ==================== Entry Point Discovery Tests ====================
 
 
+@pytest.fixture(scope="module")
+def builtin_modules_patch():
+    """sys.modules entries that stand in for the built-in action/input plugins."""
+    return {
+        "plugins.actions.github_actions": MagicMock(
+            GitHubActionsPlugin=MagicMock(
+                return_value=MagicMock(name="github_actions", version="1.0.0")
+            )
+        ),
+        "plugins.inputs.http": MagicMock(
+            HTTPInputPlugin=MagicMock(
+                return_value=MagicMock(name="http", version="1.0.0")
+            )
+        ),
+    }
+
+
+@pytest.fixture
+def mock_entry_points():
+    """Patch entry point discovery in the plugin registry."""
+    with patch("plugins.registry.entry_points") as mock:
+        yield mock
+
+
+@pytest.mark.usefixtures("fresh_registry")
 class TestEntryPointDiscovery:
     """Tests for reconciler plugin discovery via entry points."""
 
-    @pytest.fixture(autouse=True)
-    def fresh_registry(self):
-        reset_registry()
-        yield
-        reset_registry()
-
-    @patch("plugins.registry.entry_points")
-    def test_discover_reconciler_via_entry_point(self, mock_entry_points):
+    def test_discover_reconciler_via_entry_point(
+        self, mock_entry_points, builtin_modules_patch
+    ):
         """Test that reconcilers are discovered via entry points."""
         mock_ep = MagicMock()
         mock_ep.name = "dummy"
@@ -641,89 +673,34 @@ class TestEntryPointDiscovery:
 
         mock_entry_points.side_effect = ep_side_effect
 
-        from plugins.registry import register_builtin_plugins, get_registry
-
-        # Patch action/input imports to avoid failures
-        with patch(
-            "plugins.registry.GitHubActionsPlugin",
-            create=True,
-        ):
-            with patch.dict(
-                "sys.modules",
-                {
-                    "plugins.actions.github_actions": MagicMock(
-                        GitHubActionsPlugin=MagicMock(
-                            return_value=MagicMock(
-                                name="github_actions", version="1.0.0"
-                            )
-                        )
-                    ),
-                    "plugins.inputs.http": MagicMock(
-                        HTTPInputPlugin=MagicMock(
-                            return_value=MagicMock(name="http", version="1.0.0")
-                        )
-                    ),
-                },
-            ):
-                register_builtin_plugins()
+        with patch.dict("sys.modules", builtin_modules_patch):
+            register_builtin_plugins()
 
         registry = get_registry()
         mock_entry_points.assert_any_call(group="no8s.reconcilers")
         assert registry.has_reconciler_for_resource_type("DummyResource")
 
-    @patch("plugins.registry.entry_points")
-    def test_failed_entry_point_graceful(self, mock_entry_points):
+    def test_failed_entry_point_graceful(
+        self, mock_entry_points, builtin_modules_patch
+    ):
         """Test that a failing entry point is handled gracefully."""
         mock_ep = MagicMock()
         mock_ep.name = "broken"
         mock_ep.load.side_effect = ImportError("broken module")
         mock_entry_points.return_value = [mock_ep]
 
-        from plugins.registry import register_builtin_plugins, get_registry
-
-        with patch.dict(
-            "sys.modules",
-            {
-                "plugins.actions.github_actions": MagicMock(
-                    GitHubActionsPlugin=MagicMock(
-                        return_value=MagicMock(name="github_actions", version="1.0.0")
-                    )
-                ),
-                "plugins.inputs.http": MagicMock(
-                    HTTPInputPlugin=MagicMock(
-                        return_value=MagicMock(name="http", version="1.0.0")
-                    )
-                ),
-            },
-        ):
+        with patch.dict("sys.modules", builtin_modules_patch):
             # Should not raise
             register_builtin_plugins()
 
         registry = get_registry()
         assert registry.list_reconciler_plugins() == []
 
-    @patch("plugins.registry.entry_points")
-    def test_no_reconciler_entry_points(self, mock_entry_points):
+    def test_no_reconciler_entry_points(self, mock_entry_points, builtin_modules_patch):
         """Test when no reconciler entry points exist."""
         mock_entry_points.return_value = []
 
-        from plugins.registry import register_builtin_plugins, get_registry
-
-        with patch.dict(
-            "sys.modules",
-            {
-                "plugins.actions.github_actions": MagicMock(
-                    GitHubActionsPlugin=MagicMock(
-                        return_value=MagicMock(name="github_actions", version="1.0.0")
-                    )
-                ),
-                "plugins.inputs.http": MagicMock(
-                    HTTPInputPlugin=MagicMock(
-                        return_value=MagicMock(name="http", version="1.0.0")
-                    )
-                ),
-            },
-        ):
+        with patch.dict("sys.modules", builtin_modules_patch):
             register_builtin_plugins()
 
         registry = get_registry()
@@ -739,7 +716,7 @@ class TestControllerReconcilerIntegration:
 
     @pytest.fixture
     def mock_db(self):
-        db = AsyncMock()
+        db = AsyncMock(spec=DatabaseManager)
         db.get_resources_needing_reconciliation = AsyncMock(return_value=[])
         db.update_resource_status = AsyncMock()
         db.record_reconciliation = AsyncMock()
@@ -752,13 +729,6 @@ class TestControllerReconcilerIntegration:
         db.get_finalizers = AsyncMock(return_value=[])
         return db
 
-    @pytest.fixture
-    def mock_registry(self):
-        registry = MagicMock(spec=PluginRegistry)
-        registry.get_action_plugin = AsyncMock()
-        registry.list_reconciler_plugins.return_value = []
-        return registry
-
     @pytest.fixture
     def controller(self, mock_db, mock_registry):
         config = ControllerConfig(
@@ -797,6 +767,43 @@ class TestControllerReconcilerIntegration:
         # The reconciler task should have been created
         assert len(controller._reconciler_tasks) == 1
 
+    async def test_start_reconcilers_parallel(self, mock_db, mock_registry):
+        """Test all reconciler loops are running one loop tick after start-up."""
+        started = []
+        release = asyncio.Event()
+        reconcilers = {}
+
+        for i in range(10):
+            reconciler = MagicMock()
+            reconciler.name = f"reconciler_{i}"
+            reconciler.stop = AsyncMock()
+
+            async def start(ctx, name=reconciler.name):
+                started.append(name)
+                await release.wait()
+
+            reconciler.start = start
+            reconcilers[reconciler.name] = reconciler
+
+        mock_registry.list_reconciler_plugins.return_value = list(reconcilers)
+        mock_registry.get_reconciler_plugin.side_effect = reconcilers.__getitem__
+
+        controller = Controller(
+            db_manager=mock_db,
+            registry=mock_registry,
+            config=ControllerConfig(reconcile_interval=1),
+        )
+        controller.running = True
+
+        # A sequential start-up would block on the first start(); fail, don't hang
+        await asyncio.wait_for(controller._start_reconcilers(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert sorted(started) == sorted(reconcilers)
+
+        release.set()
+        await controller.stop()
+
     async def test_stop_sets_shutdown_event(self, controller):
         """Test that stop() sets the shutdown event."""
         controller.running = True
@@ -933,109 +940,97 @@ class TestControllerReconcilerIntegration:
         # Tasks should be cleared after stop
         assert len(controller._reconciler_tasks) == 0
 
+    async def test_stop_cancels_many_reconciler_tasks(self, mock_db, mock_registry):
+        """Test that stop cancels every task when many reconcilers are running."""
 
-# ==================== DatabaseManager Method Tests ====================
+        async def slow_start(ctx):
+            await asyncio.sleep(3600)
 
+        reconcilers = {}
+        for i in range(50):
+            reconciler = MagicMock()
+            reconciler.name = f"slow_{i}"
+            reconciler.start = slow_start
+            reconciler.stop = AsyncMock()
+            reconcilers[reconciler.name] = reconciler
 
-@pytest.mark.asyncio
-class TestDatabaseReconciliationByType:
-    """Tests for get_resources_needing_reconciliation_by_type."""
+        mock_registry.list_reconciler_plugins.return_value = list(reconcilers)
+        mock_registry.get_reconciler_plugin.side_effect = reconcilers.__getitem__
 
-    @pytest.fixture
-    def mock_pool(self):
-        pool = AsyncMock()
-        return pool
-
-    async def test_empty_resource_types_returns_empty(self, mock_pool):
-        """Test that empty resource_type_names returns empty list."""
-        from db import DatabaseManager
-
-        db = DatabaseManager(
-            host="localhost",
-            port=5432,
-            database="test",
-            user="test",
-            password="test",
+        controller = Controller(
+            db_manager=mock_db,
+            registry=mock_registry,
+            config=ControllerConfig(reconcile_interval=1),
         )
-        db.pool = mock_pool
+        controller.running = True
 
-        result = await db.get_resources_needing_reconciliation_by_type(
-            resource_type_names=[], limit=10
-        )
+        await controller._start_reconcilers()
+        tasks = list(controller._reconciler_tasks)
+        assert len(tasks) == 50
 
-        assert result == []
-        # Should not hit the database
-        mock_pool.acquire.assert_not_called()
-
-    async def test_filters_by_resource_type(self, mock_pool):
-        """Test that query includes resource type filter."""
-        from db import DatabaseManager
-
-        db = DatabaseManager(
-            host="localhost",
-            port=5432,
-            database="test",
-            user="test",
-            password="test",
-        )
-        db.pool = mock_pool
+        await controller.stop()
 
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[])
+        assert controller._reconciler_tasks == []
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        for reconciler in reconcilers.values():
+            reconciler.stop.assert_called_once()
 
-        @asynccontextmanager
-        async def mock_acquire():
-            yield mock_conn
 
-        mock_pool.acquire = mock_acquire
+# ==================== DatabaseManager Method Tests ====================
 
-        result = await db.get_resources_needing_reconciliation_by_type(
-            resource_type_names=["DatabaseCluster"],
-            limit=5,
-        )
 
-        assert result == []
-        # Verify the query was called with the resource type name and limit
-        call_args = mock_conn.fetch.call_args
-        assert "resource_type_name IN" in call_args[0][0]
-        assert "DatabaseCluster" in call_args[0]
-        assert 5 in call_args[0]
-
-    async def test_multiple_resource_types(self, mock_pool):
-        """Test filtering by multiple resource type names."""
-        from db import DatabaseManager
-
-        db = DatabaseManager(
-            host="localhost",
-            port=5432,
-            database="test",
-            user="test",
-            password="test",
-        )
-        db.pool = mock_pool
+@pytest.fixture(scope="module")
+def db_manager():
+    """One DatabaseManager shared by the module; tests swap in their own pool."""
+    return DatabaseManager(
+        host="localhost",
+        port=5432,
+        database="test",
+        user="test",
+        password="test",
+    )
 
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[])
 
-        @asynccontextmanager
-        async def mock_acquire():
-            yield mock_conn
+@pytest.mark.asyncio
+class TestDatabaseReconciliationByType:
+    """Tests for get_resources_needing_reconciliation_by_type."""
 
-        mock_pool.acquire = mock_acquire
+    @pytest.mark.parametrize(
+        "resource_types,limit",
+        [
+            ([], 10),
+            (["DatabaseCluster"], 5),
+            (["TypeA", "TypeB"], 10),
+        ],
+        ids=["no_types", "single_type", "multiple_types"],
+    )
+    async def test_filters_by_resource_types(
+        self, db_manager, make_pool, resource_types, limit
+    ):
+        """Test the query is filtered by resource type names and limit."""
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(return_value=[])
+        mock_pool = make_pool(mock_conn)
+        db_manager.pool = mock_pool
 
-        await db.get_resources_needing_reconciliation_by_type(
-            resource_type_names=["TypeA", "TypeB"],
-            limit=10,
+        result = await db_manager.get_resources_needing_reconciliation_by_type(
+            resource_type_names=resource_types,
+            limit=limit,
         )
 
-        call_args = mock_conn.fetch.call_args
-        query = call_args[0][0]
-        assert "$1" in query
-        assert "$2" in query
-        assert "$3" in query  # limit parameter
-        assert call_args[0][1] == "TypeA"
-        assert call_args[0][2] == "TypeB"
-        assert call_args[0][3] == 10
+        assert result == []
+        if not resource_types:
+            # Should not hit the database
+            mock_pool.acquire.assert_not_called()
+            return
+
+        query, *params = mock_conn.fetch.call_args[0]
+        assert "resource_type_name IN" in query
+        # One placeholder per resource type, then one for the limit
+        for i in range(len(resource_types) + 1):
+            assert f"${i + 1}" in query
+        assert params == [*resource_types, limit]
 
 
 # ==================== Event-driven Wake-up Tests ====================
@@ -1053,8 +1048,6 @@ class TestReconcilerContextEventBus:
         assert ctx.event_bus is None
 
     def test_event_bus_stored_when_provided(self):
-        from events import EventBus
-
         bus = EventBus()
         ctx = ReconcilerContext(
             db=AsyncMock(),
@@ -1071,22 +1064,16 @@ class TestBaseReconcilerTriggerWakeUp:
 
     @pytest.fixture
     def mock_db(self):
-        db = AsyncMock()
+        db = AsyncMock(spec=DatabaseManager)
         db.get_resources_needing_reconciliation_by_type = AsyncMock(return_value=[])
         db.record_reconciliation = AsyncMock()
         db.mark_resource_for_reconciliation = AsyncMock()
         return db
 
-    @pytest.fixture
-    def mock_registry(self):
-        return MagicMock()
-
     async def test_trigger_wakes_reconciler_before_interval(
         self, mock_db, mock_registry
     ):
         """A TRIGGER event causes the reconciler to run again before the poll interval."""
-        from events import EventBus, EventType, ResourceEvent
-
         bus = EventBus()
         shutdown_event = asyncio.Event()
 
@@ -1176,8 +1163,6 @@ class TestBaseReconcilerTriggerWakeUp:
 
     async def test_reconciler_unsubscribes_on_shutdown(self, mock_db, mock_registry):
         """After shutdown the reconciler unsubscribes from the event bus."""
-        from events import EventBus
-
         bus = EventBus()
         shutdown_event = asyncio.Event()
 